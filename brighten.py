@@ -1,7 +1,12 @@
 ﻿# brighten.py — makes an “extra-bright” version of your bright sample
 import numpy as np
 import soundfile as sf
-from scipy.signal import iirfilter, lfilter
+from scipy.signal import iirfilter, sosfilt
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
 IN_FILE  = "samples_gabo_voice_bright.wav"
 OUT_FILE = "samples_gabo_voice_extra_bright.wav"
@@ -11,15 +16,21 @@ if y.ndim > 1:
     y = y.mean(axis=1)
 
 # 3 kHz high-pass-ish filter -> blend for high-shelf effect
-b, a = iirfilter(2, 3000/(sr/2), btype="high", ftype="butter")
-y_hp = lfilter(b, a, y)
+sos = iirfilter(2, 3000/(sr/2), btype="high", ftype="butter", output="sos")
+y_hp = sosfilt(sos, y)
 
 blend = 2.5  # raise for more sparkle
-y_out = y + blend * y_hp
 
-# soft clip + normalize
-y_out = np.tanh(1.2 * y_out)
-y_out /= (np.max(np.abs(y_out)) + 1e-12)
+# blend + soft clip + normalize (fused into one pass when numexpr is available)
+if ne is not None:
+    y_out = ne.evaluate("tanh(1.2 * (y + blend * y_hp))")
+    peak = float(ne.evaluate("max(abs(y_out))"))  # reduction, no |y_out| temporary
+else:
+    y_out = y + blend * y_hp
+    y_out = np.tanh(1.2 * y_out)
+    # chunked peak so only a 1/16-size |y_out| temporary exists at a time
+    peak = max(np.abs(c).max(initial=0.0) for c in np.array_split(y_out, 16))
+y_out *= 1.0 / (peak + 1e-12)
 
 sf.write(OUT_FILE, y_out, sr)
 print(f"✓ Saved {OUT_FILE} at {sr} Hz")
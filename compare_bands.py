@@ -1,10 +1,17 @@
 # compare_bands.py — build a side-by-side bar chart from *_summary.json
 # Saves: docs/band_comparison.png
 
-import os, json
+import os
+import matplotlib
+matplotlib.use("Agg")  # PNG output only, skip GUI backend setup
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
+
 # Files to include (label, summary.json filename)
 FILES = [
     ("Demo (natural)", "samples_gabo_voice_demo_summary.json"),
@@ -14,22 +21,20 @@ FILES = [
 
 os.makedirs("docs", exist_ok=True)
 
+BAND_KEYS = ("Bass", "Formant", "Overtones")
+
 def load_bands(summary_path):
-    with open(summary_path, "r") as f:
-        data = json.load(f)
+    with open(summary_path, "rb") as f:
+        data = _jloads(f.read())
     # Expect "bands" like [{"band":"Bass 60–250 Hz","pct":67.665}, ...]
     rows = data.get("bands", [])
-    # robust: map by band name contains "Bass", "Formant", "Overtones"
-    out = {"Bass": None, "Formant": None, "Overtones": None}
+    # robust: map by band name contains "Bass", "Formant", "Overtones" (first hit wins)
+    out = dict.fromkeys(BAND_KEYS)
     for r in rows:
         name = r.get("band","")
-        pct = r.get("pct", 0.0)
-        if "Bass" in name:
-            out["Bass"] = pct
-        elif "Formant" in name:
-            out["Formant"] = pct
-        elif "Overtones" in name:
-            out["Overtones"] = pct
+        key = next((k for k in BAND_KEYS if k in name), None)
+        if key is not None:
+            out[key] = r.get("pct", 0.0)
     return out
 
 # Gather data
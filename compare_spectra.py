@@ -6,10 +6,13 @@
 # Saves: docs/real_comparison.png
 
 import os
-import csv
+import matplotlib
+matplotlib.use("Agg")  # PNG output only, skip GUI backend setup
 import matplotlib.pyplot as plt
 import numpy as np
 
+from overtone_analyzer import logdecim
+
 FILES = [
     ("Demo (natural)", "samples_gabo_voice_demo_spectrum.csv"),
     ("Bright", "samples_gabo_voice_bright_spectrum.csv"),
@@ -20,18 +23,22 @@ FILES = [
 os.makedirs("docs", exist_ok=True)
 
 def read_csv(path):
-    f, p = [], []
-    with open(path, "r", newline="") as fp:
-        r = csv.reader(fp)
-        next(r, None)  # header
-        for row in r:
-            if len(row) >= 2:
-                try:
-                    f.append(float(row[0]))
-                    p.append(float(row[1]))
-                except:
-                    pass
-    return np.array(f), np.array(p)
+    try:
+        arr = np.loadtxt(path, delimiter=",", skiprows=1, dtype=np.float64,
+                         usecols=(0, 1), ndmin=2)
+    except ValueError:
+        # Malformed rows: re-parse tolerantly. Short/long rows are dropped by
+        # invalid_raise=False, unparsable values come back as NaN and are filtered out
+        try:
+            arr = np.genfromtxt(path, delimiter=",", skip_header=1, dtype=np.float64,
+                                usecols=(0, 1), ndmin=2, invalid_raise=False)
+        except ValueError as e:
+            print(f"[skip] {path}: {e}")
+            return np.array([]), np.array([])
+        if arr.shape[1] < 2:
+            return np.array([]), np.array([])
+        arr = arr[~np.isnan(arr).any(axis=1)]
+    return arr[:, 0], arr[:, 1]
 
 def to_db(x):
     x = np.maximum(x, 1e-20)
@@ -44,6 +51,7 @@ for label, fname in FILES:
     if os.path.exists(fname):
         f, P = read_csv(fname)
         if len(f) > 0:
+            f, P = logdecim(f, P)
             plt.semilogx(f, to_db(P), label=label)
             plotted_any = True
     else:
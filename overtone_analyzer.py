@@ -4,26 +4,47 @@ Overtone Analyzer — patched
 - Fix: np.trapz -> np.trapezoid (deprecation)
 - New: --air-low / --air-high to tune “overtones” band (default 2000–8000 Hz)
 - New: --decimals to control print/label precision (default 2)
+- New: float32 pipeline by default; --fp64 keeps everything in float64
 Usage:
-  python overtone_analyzer.py <path_to_wav> [--save] [--air-low 2000] [--air-high 8000] [--decimals 2]
+  python overtone_analyzer.py <path_to_wav> [--save] [--air-low 2000] [--air-high 8000] [--decimals 2] [--fmt png|svg-fast] [--fp64]
 """
 
 import argparse
+import functools
 import os
 import json
-import csv
+from dataclasses import dataclass
+from xml.sax.saxutils import escape
 import numpy as np
-import matplotlib.pyplot as plt
 
-def read_audio(path):
-    """Try reading audio with soundfile, then scipy, then wave (PCM only). Returns (y, sr)."""
+try:
+    import orjson
+
+    def _dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dump_json(obj):
+        return json.dumps(obj, indent=2).encode()
+
+def _downmix(y):
+    """Average (N, C) samples to mono in one reduction pass, without a separate divide copy."""
+    if y.ndim == 1:
+        return y
+    out = np.empty(y.shape[0], dtype=y.dtype)
+    np.add.reduce(y, axis=1, out=out)
+    out *= 1.0 / y.shape[1]
+    return out
+
+def read_audio(path, dtype=np.float32):
+    """Try reading audio with soundfile, then scipy, then wave (PCM only). Returns (y, sr).
+    Samples come back as dtype (float32 by default; plenty for a dB-scale spectrum)."""
     # 1) soundfile (best for diverse formats)
     try:
         import soundfile as sf
-        y, sr = sf.read(path, always_2d=False)
+        y, sr = sf.read(path, always_2d=False, dtype=np.dtype(dtype).name)
         if y.ndim > 1:
-            y = y.mean(axis=1)
-        y = y.astype(np.float64, copy=False)
+            y = _downmix(y)
+        y = y.astype(dtype, copy=False)
         return y, int(sr)
     except Exception:
         pass
@@ -34,11 +55,11 @@ def read_audio(path):
         sr, y = wavfile.read(path)
         if np.issubdtype(y.dtype, np.integer):
             max_int = np.iinfo(y.dtype).max
-            y = y.astype(np.float64) / max_int
+            y = np.multiply(y, 1.0 / max_int, dtype=dtype)
         else:
-            y = y.astype(np.float64, copy=False)
+            y = y.astype(dtype, copy=False)
         if y.ndim > 1:
-            y = y.mean(axis=1)
+            y = _downmix(y)
         return y, int(sr)
     except Exception:
         pass
@@ -54,76 +75,194 @@ def read_audio(path):
             raw = wf.readframes(n_frames)
 
         if sampwidth == 1:
-            data = (np.frombuffer(raw, np.uint8).astype(np.float64) - 128.0) / 128.0
+            # cast + offset in one ufunc call, then scale in place
+            data = np.subtract(np.frombuffer(raw, np.uint8), 128.0, dtype=dtype)
+            data *= 1.0 / 128.0
         elif sampwidth == 2:
-            data = np.frombuffer(raw, np.int16).astype(np.float64) / 32768.0
+            data = np.multiply(np.frombuffer(raw, np.int16), 1.0 / 32768.0, dtype=dtype)
         elif sampwidth == 3:
             a = np.frombuffer(raw, np.uint8).reshape(-1, 3)
             b = (a[:,0].astype(np.uint32) |
                  (a[:,1].astype(np.uint32) << 8) |
                  (a[:,2].astype(np.uint32) << 16))
             mask = b & 0x800000
-            b = b | (0xFF000000 * (mask > 0))
-            data = b.view(np.int32).astype(np.float64) / 8388608.0
+            b[mask > 0] |= np.uint32(0xFF000000)  # stays uint32, so the int32 view keeps one value per sample
+            data = np.multiply(b.view(np.int32), 1.0 / 8388608.0, dtype=dtype)
         elif sampwidth == 4:
-            data = np.frombuffer(raw, np.int32).astype(np.float64) / 2147483648.0
+            data = np.multiply(np.frombuffer(raw, np.int32), 1.0 / 2147483648.0, dtype=dtype)
         else:
             raise RuntimeError("Unsupported sample width in fallback reader.")
 
         if n_channels > 1:
-            data = data.reshape(-1, n_channels).mean(axis=1)
+            data = _downmix(data.reshape(-1, n_channels))
         return data, int(sr)
     except Exception as e:
         raise RuntimeError(f"Could not read audio file '{path}'. Install 'soundfile' or 'scipy'. Error: {e}")
 
+# Files larger than this are analyzed block-by-block instead of loaded whole
+STREAM_MIN_BYTES = 50 * 1024 * 1024
+
+@functools.lru_cache(maxsize=8)
+def _hann(n, periodic=False, dtype=np.float64):
+    """Hann window of length n, cached (read-only) so repeated calls reuse the same array.
+    periodic=True gives the DFT-even window scipy.signal.welch uses for 'hann'."""
+    win = (np.hanning(n + 1)[:-1] if periodic else np.hanning(n)).astype(dtype)
+    win.flags.writeable = False
+    return win
+
+def _onesided_spectrum(P, n_segs, win):
+    """Scale a sum of |rfft(seg * win)|^2 over n_segs segments like welch(scaling='spectrum')."""
+    Pxx = P / (n_segs * float(win.sum(dtype=np.float64)) ** 2)
+    Pxx[1:-1 if len(win) % 2 == 0 else None] *= 2  # one-sided; DC and Nyquist are not doubled
+    return Pxx
+
+def _welch_batched(y, sr, nperseg, noverlap, batch=256):
+    """welch(window='hann', detrend='constant', scaling='spectrum') over a strided view of all
+    segments. Each batch of segments is windowed at once and goes through one threaded rfft."""
+    from scipy.fft import rfft
+    win = _hann(nperseg, periodic=True, dtype=y.dtype)
+    segs = np.lib.stride_tricks.sliding_window_view(y, nperseg)[::nperseg - noverlap]
+    P = np.zeros(nperseg // 2 + 1)
+    for i in range(0, len(segs), batch):
+        block = segs[i:i + batch]
+        block = (block - block.mean(axis=1, keepdims=True)) * win
+        P += (np.abs(rfft(block, axis=1, workers=-1)) ** 2).sum(axis=0)
+    f = np.fft.rfftfreq(nperseg, d=1.0/sr)
+    return f, _onesided_spectrum(P, len(segs), win)
+
 def compute_psd(y, sr):
-    """Return frequency (Hz) and power spectral density using Welch if available, else FFT fallback."""
-    y = y - np.mean(y)
+    """Return frequency (Hz) and power spectral density using Welch if available, else FFT fallback.
+    Note: the FFT fallback removes the DC offset in place when y is a writeable float array."""
+    # No global DC removal on the Welch paths: detrend='constant' already subtracts each segment's mean
     try:
         from scipy.signal import welch
         nperseg = min(len(y), 8192)
         nperseg = max(nperseg, 256)
-        f, Pxx = welch(y, fs=sr, window='hann', nperseg=nperseg,
+        # The window array must fit the clip (a 'hann' string let welch shrink nperseg itself)
+        nperseg = min(nperseg, len(y))
+        # Long clips: batch the segment FFTs ourselves so they run across all cores
+        if len(y) / nperseg > 8:
+            return _welch_batched(y, sr, nperseg, nperseg//2)
+        # Pass the cached window array so welch doesn't rebuild it on every call
+        f, Pxx = welch(y, fs=sr, window=_hann(nperseg, periodic=True, dtype=y.dtype), nperseg=nperseg,
                        noverlap=nperseg//2, detrend='constant', scaling='spectrum')
         return f, Pxx
     except Exception:
+        if y.dtype.kind == 'f' and y.flags.writeable:
+            y -= y.mean()
+        else:
+            y = y - y.mean()
         n = len(y)
-        n_fft = 1
-        while n_fft < n:
-            n_fft <<= 1
-        win = np.hanning(n)
-        Y = np.fft.rfft(y[:n] * win, n=n_fft)
+        win = _hann(n, dtype=y.dtype)
+        try:
+            # pocketfft handles any fast length, so no power-of-two zero-pad
+            from scipy.fft import rfft, next_fast_len
+            n_fft = next_fast_len(n, real=True)
+            Y = rfft(y[:n] * win, n=n_fft, workers=-1)
+        except ImportError:
+            n_fft = 1
+            while n_fft < n:
+                n_fft <<= 1
+            Y = np.fft.rfft(y[:n] * win, n=n_fft)
         Pxx = (np.abs(Y) ** 2) / (np.sum(win**2) * sr)
         f = np.fft.rfftfreq(n_fft, d=1.0/sr)
         return f, Pxx
 
-def band_energy(f, Pxx, f_lo, f_hi):
-    idx = np.where((f >= f_lo) & (f < f_hi))[0]
-    if idx.size == 0:
-        return 0.0
-    # np.trapz -> np.trapezoid
-    return float(np.trapezoid(Pxx[idx], f[idx]))
+def cumulative_energy(f, Pxx):
+    """Running trapezoidal integral of Pxx over f, with C[0] = 0 (same length as f)."""
+    C = np.empty(len(f), dtype=np.float64)
+    C[:1] = 0.0
+    np.cumsum(0.5 * (Pxx[1:] + Pxx[:-1]) * np.diff(f), dtype=np.float64, out=C[1:])
+    return C
 
-def summarize_bands(f, Pxx, air_lo, air_hi):
-    # Ignore <20 Hz
-    mask = f >= 20
-    total = float(np.trapezoid(Pxx[mask], f[mask]))
-    if total <= 0:
-        total = 1e-12
+def compute_psd_streamed(path, nperseg=8192, dtype=np.float32):
+    """Welch PSD accumulated block-by-block from disk (needs soundfile). Returns (f, Pxx, sr, n_frames).
+    Same settings as compute_psd's Welch path, without holding the whole waveform in memory."""
+    import soundfile as sf
+    try:
+        from scipy.fft import rfft
+        rfft = functools.partial(rfft, workers=-1)
+    except ImportError:
+        rfft = np.fft.rfft
+
+    win = _hann(nperseg, periodic=True, dtype=dtype)
+    P = np.zeros(nperseg // 2 + 1)
+    segs = 0
+    with sf.SoundFile(path) as fp:
+        sr = fp.samplerate
+        n_frames = fp.frames
+        for block in fp.blocks(blocksize=nperseg, overlap=nperseg // 2,
+                               dtype=np.dtype(dtype).name, always_2d=False):
+            if block.ndim > 1:
+                block = _downmix(block)
+            if len(block) < nperseg:
+                break  # welch drops the trailing partial segment too
+            block = block - block.mean()
+            P += np.abs(rfft(block * win)) ** 2
+            segs += 1
+    if segs == 0:
+        raise RuntimeError(f"'{path}' is shorter than one {nperseg}-sample segment.")
+
+    f = np.fft.rfftfreq(nperseg, d=1.0/sr)
+    return f, _onesided_spectrum(P, segs, win), int(sr), n_frames
 
-    bands = [
+def band_energy(f, Pxx, f_lo, f_hi, C=None):
+    """Energy in [f_lo, f_hi). Pass C from cumulative_energy() to skip the mask + trapezoid."""
+    if C is None:
+        idx = np.where((f >= f_lo) & (f < f_hi))[0]
+        if idx.size == 0:
+            return 0.0
+        # np.trapz -> np.trapezoid
+        return float(np.trapezoid(Pxx[idx], f[idx]))
+    # f is sorted, so the band is the index run [i0, i1); integrate over its own bins only
+    i0 = np.searchsorted(f, f_lo, side='left')
+    i1 = np.searchsorted(f, f_hi, side='left')
+    if i1 - i0 < 2:
+        return 0.0
+    return float(C[i1 - 1] - C[i0])
+
+def _band_defs(air_lo, air_hi):
+    return [
         ("Bass 60–250 Hz", 60, 250),
         ("Formant 400–1500 Hz", 400, 1500),
         (f"Overtones {int(air_lo/1000)}–{int(air_hi/1000)} kHz" if air_lo>=1000 else f"Overtones {int(air_lo)}–{int(air_hi/1000)} kHz",
          air_lo, air_hi),
     ]
 
+def _band_rows(bands, energies, total):
     out = []
-    for name, lo, hi in bands:
-        e = band_energy(f, Pxx, lo, hi)
+    for (name, lo, hi), e in zip(bands, energies):
         pct = 100.0 * e / total
         out.append({"band": name, "lo_hz": lo, "hi_hz": hi, "energy": e, "pct": pct})
-    return out, total, bands
+    return out
+
+@dataclass
+class PsdResult:
+    """A PSD plus the arrays derived from it. Each derived array is computed on first use and
+    then shared by the summary, plot and CSV steps."""
+    f: np.ndarray
+    Pxx: np.ndarray
+
+    @functools.cached_property
+    def db(self):
+        return 10*np.log10(self.Pxx + 1e-20)
+
+    @functools.cached_property
+    def cumE(self):
+        return cumulative_energy(np.ascontiguousarray(self.f), np.ascontiguousarray(self.Pxx))
+
+def summarize_bands(f, Pxx, air_lo, air_hi, C=None):
+    f = np.ascontiguousarray(f)
+    if C is None:
+        C = cumulative_energy(f, np.ascontiguousarray(Pxx))
+    # Ignore <20 Hz
+    total = band_energy(f, Pxx, 20, np.inf, C=C)
+    if total <= 0:
+        total = 1e-12
+
+    bands = _band_defs(air_lo, air_hi)
+    energies = [band_energy(f, Pxx, lo, hi, C=C) for _, lo, hi in bands]
+    return _band_rows(bands, energies, total), total, bands
 
 def estimate_fundamental(f, Pxx, lo=60, hi=300):
     idx = np.where((f >= lo) & (f <= hi))[0]
@@ -134,36 +273,137 @@ def estimate_fundamental(f, Pxx, lo=60, hi=300):
         return None
     return float(sub_f[np.argmax(sub_p)])
 
-def save_spectrum_plot(out_path, f, Pxx, title="Spectrum"):
-    plt.figure()
-    plt.semilogx(f, 10*np.log10(Pxx + 1e-20))
-    plt.xlabel("Frequency (Hz)")
-    plt.ylabel("Power (dB)")
-    plt.title(title)
-    plt.grid(True, which='both', ls=':')
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=140)
-    plt.close()
-
-def save_bars_plot(out_path, bands, decimals=2):
+def analyze_psd(res, air_lo, air_hi, f0_lo=60, f0_hi=300):
+    """Band rows, total, band defs and fundamental for a PsdResult: (rows, total, bands, f0)."""
+    rows, total, bands = summarize_bands(res.f, res.Pxx, air_lo, air_hi, C=res.cumE)
+    return rows, total, bands, estimate_fundamental(res.f, res.Pxx, f0_lo, f0_hi)
+
+def _new_axes(figsize=None, dpi=140):
+    """Axes on a bare Agg-backed Figure (no pyplot state machine); dpi is the PNG output dpi."""
+    # matplotlib is imported here, not at module level, so --fmt svg-fast never loads it
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    return fig.add_subplot(111)
+
+def _begin_plot(ax):
+    """Return (fig, ax): the given axes cleared for reuse, or fresh axes if ax is None."""
+    if ax is None:
+        ax = _new_axes()
+    else:
+        ax.clear()
+    return ax.figure, ax
+
+def _end_plot(fig, out_path):
+    # Render once and hand the RGBA buffer to PIL; low compression keeps the encode cheap
+    from PIL import Image
+    fig.tight_layout()
+    fig.canvas.draw()
+    Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(
+        out_path, format='PNG', compress_level=1, dpi=(fig.dpi, fig.dpi))
+
+def logdecim(f, P, n=2000):
+    """Thin (f, P) to at most ~n log-spaced buckets, keeping each bucket's peak, for a log x-axis."""
+    if len(f) <= n:
+        return f, P
+    lf = np.log10(np.maximum(f, 1e-6))
+    edges = np.linspace(lf[1], lf[-1], n + 1)
+    starts = np.unique(np.clip(np.searchsorted(lf, edges), 1, len(f) - 1))
+    # Keep each bucket's peak bin (not its first bin) so narrow harmonics survive
+    lens = np.diff(np.append(starts, len(f)))
+    bucket = np.repeat(np.arange(len(starts)), lens)
+    sub = P[starts[0]:]
+    hit = sub == np.maximum.reduceat(sub, starts - starts[0])[bucket]
+    _, first = np.unique(bucket[hit], return_index=True)
+    idx = np.flatnonzero(hit)[first] + starts[0]
+    return f[idx], P[idx]
+
+def save_spectrum_plot(out_path, res, title="Spectrum", ax=None):
+    fig, ax = _begin_plot(ax)
+    f, db = logdecim(res.f, res.db)
+    ax.semilogx(f, db)
+    ax.set_xlabel("Frequency (Hz)")
+    ax.set_ylabel("Power (dB)")
+    ax.set_title(title)
+    ax.grid(True, which='both', ls=':')
+    _end_plot(fig, out_path)
+
+def save_bars_plot(out_path, bands, decimals=2, ax=None):
     labels = [b["band"] for b in bands]
     vals = [b["pct"] for b in bands]
-    plt.figure()
-    plt.bar(labels, vals)
-    plt.ylabel("Energy (%)")
-    plt.title("Band Energy Distribution")
+    fig, ax = _begin_plot(ax)
+    ax.bar(labels, vals)
+    ax.set_ylabel("Energy (%)")
+    ax.set_title("Band Energy Distribution")
     for i, v in enumerate(vals):
-        plt.text(i, v + 1, f"{v:.{decimals}f}%", ha='center', va='bottom', fontsize=9)
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=140)
-    plt.close()
+        ax.text(i, v + 1, f"{v:.{decimals}f}%", ha='center', va='bottom', fontsize=9)
+    _end_plot(fig, out_path)
+
+# Plain-SVG output for --fmt svg-fast: fixed canvas, (left, right, top, bottom) plot margins
+SVG_W, SVG_H = 800, 400
+SVG_PAD = (60, 20, 40, 50)
+
+def _write_svg(out_path, title, body):
+    with open(out_path, 'w', encoding='utf-8') as fp:
+        fp.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_W}" height="{SVG_H}" '
+                 f'viewBox="0 0 {SVG_W} {SVG_H}" font-family="sans-serif" font-size="12">\n'
+                 f'<rect width="{SVG_W}" height="{SVG_H}" fill="white"/>\n'
+                 f'<text x="{SVG_W / 2}" y="24" text-anchor="middle" font-size="14">{escape(title)}</text>\n')
+        fp.write("\n".join(body))
+        fp.write("\n</svg>\n")
+
+def save_spectrum_svg(out_path, res, title="Spectrum"):
+    """Spectrum as a single SVG polyline on a log-frequency axis, written without matplotlib."""
+    l, r, t, b = SVG_PAD
+    pw, ph = SVG_W - l - r, SVG_H - t - b
+    # Peak-preserving thinning to one bucket per horizontal pixel of the plot area
+    f, db = logdecim(res.f, res.db, n=pw)
+    keep = f > 0
+    lf, db = np.log10(f[keep]), db[keep]
+    x_lo, x_hi = float(lf[0]), float(lf[-1])
+    y_lo, y_hi = float(db.min()), float(db.max())
+    xs = l + (lf - x_lo) / ((x_hi - x_lo) or 1.0) * pw
+    ys = t + (y_hi - db) / ((y_hi - y_lo) or 1.0) * ph
+
+    body = [f'<rect x="{l}" y="{t}" width="{pw}" height="{ph}" fill="none" stroke="black"/>']
+    for k in range(int(np.ceil(x_lo)), int(np.floor(x_hi)) + 1):
+        x = l + (k - x_lo) / ((x_hi - x_lo) or 1.0) * pw
+        body.append(f'<line x1="{x:.1f}" y1="{t}" x2="{x:.1f}" y2="{t + ph}" stroke="#ccc" stroke-dasharray="2,2"/>')
+        body.append(f'<text x="{x:.1f}" y="{t + ph + 16}" text-anchor="middle">{10**k:g}</text>')
+    for v in np.linspace(y_lo, y_hi, 5):
+        y = t + (y_hi - v) / ((y_hi - y_lo) or 1.0) * ph
+        body.append(f'<text x="{l - 6}" y="{y + 4:.1f}" text-anchor="end">{v:.0f}</text>')
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    body.append(f'<polyline points="{points}" fill="none" stroke="#1f77b4" stroke-width="1.5"/>')
+    body.append(f'<text x="{l + pw / 2}" y="{SVG_H - 10}" text-anchor="middle">Frequency (Hz)</text>')
+    body.append(f'<text x="16" y="{t + ph / 2}" text-anchor="middle" transform="rotate(-90 16 {t + ph / 2})">Power (dB)</text>')
+    _write_svg(out_path, title, body)
+
+def save_bars_svg(out_path, bands, decimals=2):
+    """Band-energy bars as plain SVG rects with value and band labels, written without matplotlib."""
+    l, r, t, b = SVG_PAD
+    pw, ph = SVG_W - l - r, SVG_H - t - b
+    vals = [b["pct"] for b in bands]
+    top = max(max(vals, default=0.0) * 1.1, 1.0)
+    slot = pw / max(len(vals), 1)
+
+    body = [f'<line x1="{l}" y1="{t + ph}" x2="{l + pw}" y2="{t + ph}" stroke="black"/>',
+            f'<line x1="{l}" y1="{t}" x2="{l}" y2="{t + ph}" stroke="black"/>']
+    for i, (row, v) in enumerate(zip(bands, vals)):
+        h = max(v, 0.0) / top * ph
+        cx = l + (i + 0.5) * slot
+        body.append(f'<rect x="{cx - 0.4 * slot:.1f}" y="{t + ph - h:.1f}" width="{0.8 * slot:.1f}" '
+                    f'height="{h:.1f}" fill="#1f77b4"/>')
+        body.append(f'<text x="{cx:.1f}" y="{t + ph - h - 4:.1f}" text-anchor="middle" font-size="10">{v:.{decimals}f}%</text>')
+        body.append(f'<text x="{cx:.1f}" y="{t + ph + 18}" text-anchor="middle">{escape(row["band"])}</text>')
+    body.append(f'<text x="16" y="{t + ph / 2}" text-anchor="middle" transform="rotate(-90 16 {t + ph / 2})">Energy (%)</text>')
+    _write_svg(out_path, "Band Energy Distribution", body)
 
 def save_csv(out_path, f, Pxx):
-    with open(out_path, 'w', newline='') as fp:
-        w = csv.writer(fp)
-        w.writerow(["freq_hz", "power"])
-        for fi, pi in zip(f, Pxx):
-            w.writerow([fi, pi])
+    # One bulk write instead of a csv.writer call per bin
+    arr = np.column_stack((np.asarray(f, dtype=np.float64), np.asarray(Pxx, dtype=np.float64)))
+    np.savetxt(out_path, arr, delimiter=',', header='freq_hz,power', comments='', fmt='%.8g')
 
 def main():
     ap = argparse.ArgumentParser(description="Simple Overtone Analyzer")
@@ -172,6 +412,9 @@ def main():
     ap.add_argument("--air-low", type=float, default=2000.0, help="Overtones band low edge in Hz (default 2000)")
     ap.add_argument("--air-high", type=float, default=8000.0, help="Overtones band high edge in Hz (default 8000)")
     ap.add_argument("--decimals", type=int, default=2, help="Decimal places for printed/label percentages (default 2)")
+    ap.add_argument("--fmt", choices=["png", "svg-fast"], default="png",
+                    help="Plot format for --save: matplotlib PNGs, or plain SVGs written without matplotlib (default png)")
+    ap.add_argument("--fp64", action="store_true", help="Run the pipeline in float64 instead of float32 (for regression checks)")
     args = ap.parse_args()
 
     path = args.wav
@@ -179,12 +422,20 @@ def main():
         print(f"ERROR: File not found: {path}")
         raise SystemExit(1)
 
-    y, sr = read_audio(path)
-    duration = len(y) / sr
-
-    f, Pxx = compute_psd(y, sr)
-    band_rows, total, band_defs = summarize_bands(f, Pxx, args.air_low, args.air_high)
-    f0 = estimate_fundamental(f, Pxx)
+    dtype = np.float64 if args.fp64 else np.float32
+    streamed = os.path.getsize(path) > STREAM_MIN_BYTES
+    if streamed:
+        try:
+            f, Pxx, sr, n_frames = compute_psd_streamed(path, dtype=dtype)
+            duration = n_frames / sr
+        except Exception:
+            streamed = False
+    if not streamed:
+        y, sr = read_audio(path, dtype=dtype)
+        duration = len(y) / sr
+        f, Pxx = compute_psd(y, sr)
+    res = PsdResult(f, Pxx)
+    band_rows, total, band_defs, f0 = analyze_psd(res, args.air_low, args.air_high)
 
     # Output
     print("\n=== Overtone Analyzer ===")
@@ -200,14 +451,22 @@ def main():
 
     if args.save:
         base = os.path.splitext(path)[0]
-        spec_png = base + "_spectrum.png"
-        bars_png = base + "_bands.png"
+        ext = ".svg" if args.fmt == "svg-fast" else ".png"
+        spec_img = base + "_spectrum" + ext
+        bars_img = base + "_bands" + ext
         csv_path = base + "_spectrum.csv"
         json_path = base + "_summary.json"
 
-        save_spectrum_plot(spec_png, f, Pxx, title=f"Spectrum — {os.path.basename(path)}")
-        save_bars_plot(bars_png, band_rows, decimals=args.decimals)
-        save_csv(csv_path, f, Pxx)
+        spec_title = f"Spectrum — {os.path.basename(path)}"
+        if args.fmt == "svg-fast":
+            save_spectrum_svg(spec_img, res, title=spec_title)
+            save_bars_svg(bars_img, band_rows, decimals=args.decimals)
+        else:
+            # One figure shared by both plots; each save clears the axes first
+            ax = _new_axes(figsize=(8, 4))
+            save_spectrum_plot(spec_img, res, title=spec_title, ax=ax)
+            save_bars_plot(bars_img, band_rows, decimals=args.decimals, ax=ax)
+        save_csv(csv_path, res.f, res.Pxx)
 
         summary = {
             "file": os.path.basename(path),
@@ -219,10 +478,10 @@ def main():
             "air_band_hz": [args.air_low, args.air_high],
             "decimals": args.decimals,
         }
-        with open(json_path, 'w') as fp:
-            json.dump(summary, fp, indent=2)
+        with open(json_path, 'wb') as fp:
+            fp.write(_dump_json(summary))
 
-        print(f"\nSaved: {os.path.basename(spec_png)}, {os.path.basename(bars_png)},")
+        print(f"\nSaved: {os.path.basename(spec_img)}, {os.path.basename(bars_img)},")
         print(f"       {os.path.basename(csv_path)}, {os.path.basename(json_path)}")
 
 if __name__ == "__main__":